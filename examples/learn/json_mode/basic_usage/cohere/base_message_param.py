@@ -1,6 +1,5 @@
-import json
-
 from mirascope.core import BaseMessageParam, cohere
+from pydantic import TypeAdapter
 
 
 @cohere.call("command-r-plus", json_mode=True)
@@ -13,5 +12,5 @@ def get_book_info(book_title: str) -> list[BaseMessageParam]:
 
 
 response = get_book_info("The Name of the Wind")
-print(json.loads(response.content))
+print(TypeAdapter(dict).validate_json(response.content))
 # Output: {'author': 'Patrick Rothfuss', 'genre': 'Fantasy'}
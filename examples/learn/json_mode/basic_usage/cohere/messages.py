@@ -1,6 +1,5 @@
-import json
-
 from mirascope.core import Messages, cohere
+from pydantic import TypeAdapter
 
 
 @cohere.call("command-r-plus", json_mode=True)
@@ -9,5 +8,5 @@ def get_book_info(book_title: str) -> Messages.Type:
 
 
 response = get_book_info("The Name of the Wind")
-print(json.loads(response.content))
+print(TypeAdapter(dict).validate_json(response.content))
 # Output: {'author': 'Patrick Rothfuss', 'genre': 'Fantasy'}
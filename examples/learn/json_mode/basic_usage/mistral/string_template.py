@@ -1,6 +1,5 @@
-import json
-
 from mirascope.core import mistral, prompt_template
+from pydantic import TypeAdapter
 
 
 @mistral.call("mistral-large-latest", json_mode=True)
@@ -9,5 +8,5 @@ def get_book_info(book_title: str): ...
 
 
 response = get_book_info("The Name of the Wind")
-print(json.loads(response.content))
+print(TypeAdapter(dict).validate_json(response.content))
 # Output: {'author': 'Patrick Rothfuss', 'genre': 'Fantasy'}
@@ -1,5 +1,3 @@
-from typing import cast
-
 from mirascope.core import BaseMessageParam, anthropic
 from pydantic import BaseModel
 
@@ -10,6 +8,8 @@ class Book(BaseModel):
     title: str
     author: str
 
+    _response: anthropic.AnthropicCallResponse
+
 
 @anthropic.call("claude-3-5-sonnet-20240620", response_model=Book)
 def extract_book(text: str) -> list[BaseMessageParam]:
@@ -20,6 +20,5 @@ book = extract_book("The Name of the Wind by Patrick Rothfuss")
 print(book)
 # Output: title='The Name of the Wind' author='Patrick Rothfuss'
 
-response = cast(anthropic.AnthropicCallResponse, book._response)  # pyright: ignore[reportAttributeAccessIssue]
-print(response.model_dump())
+print(book._response.model_dump())
 # > {'metadata': {}, 'response': {'id': ...}, ...}
@@ -1,5 +1,3 @@
-from typing import cast
-
 from mirascope.core import Messages, azure
 from pydantic import BaseModel
 
@@ -10,6 +8,8 @@ class Book(BaseModel):
     title: str
     author: str
 
+    _response: azure.AzureCallResponse
+
 
 @azure.call("gpt-4o-mini", response_model=Book)
 def extract_book(text: str) -> Messages.Type:
@@ -20,6 +20,5 @@ book = extract_book("The Name of the Wind by Patrick Rothfuss")
 print(book)
 # Output: title='The Name of the Wind' author='Patrick Rothfuss'
 
-response = cast(azure.AzureCallResponse, book._response)  # pyright: ignore[reportAttributeAccessIssue]
-print(response.model_dump())
+print(book._response.model_dump())
 # > {'metadata': {}, 'response': {'id': ...}, ...}
@@ -1,8 +1,7 @@
 from typing import Annotated
 
 from mirascope.core import FromCallArgs, anthropic
-from pydantic import BaseModel, model_validator
-from typing_extensions import Self
+from pydantic import BaseModel, ValidationInfo, field_validator
 
 
 class Book(BaseModel):
@@ -14,11 +13,12 @@ class Books(BaseModel):
     texts: Annotated[list[str], FromCallArgs()]
     books: list[Book]
 
-    @model_validator(mode="after")
-    def validate_output_length(self) -> Self:
-        if len(self.texts) != len(self.books):
+    @field_validator("books")
+    @classmethod
+    def validate_output_length(cls, v: list[Book], info: ValidationInfo) -> list[Book]:
+        if "texts" in info.data and len(v) != len(info.data["texts"]):
             raise ValueError("length mismatch...")
-        return self
+        return v
 
 
 @anthropic.call("claude-3-5-sonnet-20240620", response_model=Books)
@@ -0,0 +1,32 @@
+import asyncio
+
+from mirascope.core import anthropic, prompt_template
+from pydantic import BaseModel
+
+
+class Book(BaseModel):
+    title: str
+    author: str
+
+
+@anthropic.call("claude-3-5-sonnet-20240620", response_model=Book)
+@prompt_template("Extract the book from this text: {text}")
+async def extract_book(text: str): ...
+
+
+async def extract_books(texts: list[str]) -> list[Book]:
+    semaphore = asyncio.Semaphore(8)
+
+    async def extract_one(text: str) -> Book:
+        async with semaphore:
+            return await extract_book(text)
+
+    return await asyncio.gather(*[extract_one(text) for text in texts])
+
+
+texts = [
+    "The Name of the Wind by Patrick Rothfuss",
+    "Mistborn: The Final Empire by Brandon Sanderson",
+]
+print(asyncio.run(extract_books(texts)))
+# Output: [Book(title='The Name of the Wind', author='Patrick Rothfuss'), Book(title='Mistborn: The Final Empire', author='Brandon Sanderson')]
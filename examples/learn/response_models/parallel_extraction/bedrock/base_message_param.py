@@ -0,0 +1,36 @@
+import asyncio
+
+from mirascope.core import BaseMessageParam, bedrock
+from pydantic import BaseModel
+
+
+class Book(BaseModel):
+    title: str
+    author: str
+
+
+@bedrock.call(model="anthropic.claude-3-haiku-20240307-v1:0", response_model=Book)
+async def extract_book(text: str) -> list[BaseMessageParam]:
+    return [
+        BaseMessageParam(
+            role="user", content=f"Extract the book from this text: {text}"
+        )
+    ]
+
+
+async def extract_books(texts: list[str]) -> list[Book]:
+    semaphore = asyncio.Semaphore(8)
+
+    async def extract_one(text: str) -> Book:
+        async with semaphore:
+            return await extract_book(text)
+
+    return await asyncio.gather(*[extract_one(text) for text in texts])
+
+
+texts = [
+    "The Name of the Wind by Patrick Rothfuss",
+    "Mistborn: The Final Empire by Brandon Sanderson",
+]
+print(asyncio.run(extract_books(texts)))
+# Output: [Book(title='The Name of the Wind', author='Patrick Rothfuss'), Book(title='Mistborn: The Final Empire', author='Brandon Sanderson')]
@@ -1,6 +1,8 @@
 """The Mirascope Core Functionality."""
 
-from contextlib import suppress
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from . import base
 from .base import (
@@ -9,40 +11,60 @@ from .base import (
     BasePrompt,
     BaseTool,
     BaseToolKit,
+    ExtractionCache,
     FromCallArgs,
     Messages,
     ResponseModelConfigDict,
+    SemanticExtractionCache,
     metadata,
     prompt_template,
     toolkit_tool,
 )
 
-with suppress(ImportError):
-    from . import anthropic as anthropic
-
-with suppress(ImportError):
-    from . import cohere as cohere
-
-with suppress(ImportError):
-    from . import gemini as gemini
-
-with suppress(ImportError):
-    from . import groq as groq
+_PROVIDERS = {
+    "anthropic",
+    "azure",
+    "cohere",
+    "gemini",
+    "groq",
+    "litellm",
+    "mistral",
+    "openai",
+    "vertex",
+}
 
-with suppress(ImportError):
-    from . import litellm as litellm
+if TYPE_CHECKING:
+    from . import (
+        anthropic,
+        azure,
+        cohere,
+        gemini,
+        groq,
+        litellm,
+        mistral,
+        openai,
+        vertex,
+    )
 
-with suppress(ImportError):
-    from . import mistral as mistral
 
-with suppress(ImportError):
-    from . import openai as openai
+def __getattr__(name: str) -> ModuleType:
+    """Imports provider modules on first access.
 
-with suppress(ImportError):
-    from . import vertex as vertex
+    Importing a provider also imports its SDK, which can take hundreds of milliseconds
+    (e.g. `google.generativeai`), so we only import the providers that are used. A
+    provider whose SDK is not installed raises an `AttributeError` just like a missing
+    attribute, and `from mirascope.core import gemini` surfaces the original
+    `ImportError`.
+    """
+    if name in _PROVIDERS:
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ImportError as e:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from e
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-with suppress(ImportError):
-    from . import azure as azure
 
 __all__ = [
     "anthropic",
@@ -54,6 +76,7 @@ __all__ = [
     "BaseTool",
     "BaseToolKit",
     "cohere",
+    "ExtractionCache",
     "FromCallArgs",
     "gemini",
     "groq",
@@ -64,6 +87,7 @@ __all__ = [
     "openai",
     "prompt_template",
     "ResponseModelConfigDict",
+    "SemanticExtractionCache",
     "toolkit_tool",
     "vertex",
 ]
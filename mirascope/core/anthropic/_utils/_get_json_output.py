@@ -1,6 +1,6 @@
 """Get the JSON output from an anthropic call response or chunk."""
 
-import json
+from pydantic_core import to_json
 
 from ..call_response import AnthropicCallResponse
 from ..call_response_chunk import AnthropicCallResponseChunk
@@ -17,7 +17,7 @@ def get_json_output(
             return content[json_start : json_end + 1]
         for block in response.response.content:
             if block.type == "tool_use" and block.input is not None:
-                return json.dumps(block.input)
+                return to_json(block.input).decode()
         raise ValueError("No tool call or JSON object found in response.")
     else:
         if json_mode:
@@ -120,6 +120,10 @@ def setup_call(
     }
 
     if client is None:
-        client = AsyncAnthropic() if inspect.iscoroutinefunction(fn) else Anthropic()
+        client = (
+            AsyncAnthropic()
+            if inspect.iscoroutinefunction(fn)
+            else _utils.get_default_client(Anthropic)
+        )
     create = client.messages.create
     return create, prompt_template, messages, tool_types, call_kwargs
@@ -1,6 +1,7 @@
 """Mirascope Base Classes."""
 
 from . import _partial, _utils
+from ._cache import ExtractionCache, SemanticExtractionCache
 from ._call_factory import call_factory
 from ._utils import BaseType
 from .call_kwargs import BaseCallKwargs
@@ -41,6 +42,7 @@ __all__ = [
     "BaseType",
     "CacheControlPart",
     "call_factory",
+    "ExtractionCache",
     "FromCallArgs",
     "GenerateJsonSchemaNoTitles",
     "ImagePart",
@@ -49,6 +51,7 @@ __all__ = [
     "Metadata",
     "prompt_template",
     "ResponseModelConfigDict",
+    "SemanticExtractionCache",
     "TextPart",
     "ToolConfig",
     "toolkit_tool",
@@ -0,0 +1,353 @@
+"""The `ExtractionCache` classes for caching extracted response models on disk."""
+
+import hashlib
+import math
+import operator
+import os
+import sqlite3
+import tempfile
+import threading
+from array import array
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple, Protocol
+
+from typing_extensions import Self
+
+try:
+    import blake3
+
+    has_blake3 = True
+except ImportError:  # pragma: no cover
+    has_blake3 = False
+
+
+class KeyHasher(Protocol):
+    """The interface shared by `blake3.blake3` and `hashlib` hash objects."""
+
+    def update(self, data: bytes, /) -> object: ...
+
+    def copy(self) -> Self: ...
+
+    def hexdigest(self) -> str: ...
+
+
+def _new_hasher() -> KeyHasher:
+    """Returns a BLAKE3 hasher if `blake3` is installed, otherwise SHA-256."""
+    if has_blake3:
+        return blake3.blake3()  # pyright: ignore [reportPossiblyUnbound]
+    return hashlib.sha256()
+
+
+def _update_hasher(hasher: KeyHasher, fields: tuple[str | bytes, ...]) -> None:
+    """Updates `hasher` with each field prefixed by its length."""
+    for field in fields:
+        data = field.encode() if isinstance(field, str) else field
+        hasher.update(len(data).to_bytes(8, "little"))
+        hasher.update(data)
+
+
+class CacheKey(NamedTuple):
+    """The keys under which the output of a call is cached.
+
+    Attributes:
+        key: The digest of everything sent to the provider.
+        scope: The digest of everything except the variable inputs of the call.
+        text: The text inputs of the call (its arguments and computed fields).
+    """
+
+    key: str
+    scope: str
+    text: str
+
+
+class ExtractionCache:
+    """A content-addressable, disk-backed cache for extracted response models.
+
+    usage docs: learn/response_models.md#caching-response-models
+
+    Each entry is stored as a JSON file in `cache_dir` whose name is a digest of the
+    provider, model, rendered messages, call parameters, and response model schema of
+    the call. Entries hold the raw JSON output of the provider, so on a hit it is
+    validated into the `response_model` exactly as a fresh output would be (aliases,
+    validators, and all) without calling the provider API at all.
+
+    Since a hit skips the API call entirely, you should only use the cache with
+    deterministic prompts (e.g. `temperature=0`). Outputs returned from the cache do not
+    have the `_response` attribute set since there is no original call response.
+
+    Example:
+
+    ```python
+    from mirascope.core import ExtractionCache, openai
+    from pydantic import BaseModel
+
+
+    class Book(BaseModel):
+        title: str
+        author: str
+
+
+    @openai.call(
+        "gpt-4o-mini",
+        response_model=Book,
+        cache=ExtractionCache(),
+        call_params={"temperature": 0},
+    )
+    def extract_book(text: str) -> str:
+        return f"Extract {text}"
+
+
+    book = extract_book("The Name of the Wind by Patrick Rothfuss")  # API call
+    book = extract_book("The Name of the Wind by Patrick Rothfuss")  # cache hit
+    ```
+    """
+
+    cache_dir: Path
+
+    def __init__(self, cache_dir: str | os.PathLike[str] | None = None) -> None:
+        """Initializes an instance of `ExtractionCache`.
+
+        Args:
+            cache_dir: The directory in which to store cache entries. Defaults to
+                `~/.cache/mirascope`.
+        """
+        self.cache_dir = (
+            Path(cache_dir)
+            if cache_dir is not None
+            else Path.home() / ".cache" / "mirascope"
+        )
+
+    @staticmethod
+    def hasher(*fields: str | bytes) -> KeyHasher:
+        """Returns a hasher that has already consumed the given `fields`.
+
+        Pass the result as the `prefix` of `key` to avoid rehashing fields that are
+        shared by many keys (e.g. those fixed at decoration time).
+
+        Args:
+            fields: The fields with which to seed the hasher.
+        """
+        hasher = _new_hasher()
+        _update_hasher(hasher, fields)
+        return hasher
+
+    @staticmethod
+    def key(*fields: str | bytes, prefix: KeyHasher | None = None) -> str:
+        """Returns the hex digest of the given `fields`.
+
+        Each field is prefixed with its length so that the boundaries between fields
+        are part of the digest (i.e. `("ab", "c")` and `("a", "bc")` differ). We use
+        BLAKE3 when the `blake3` package is installed (`pip install "mirascope[cache]"`)
+        and fall back to SHA-256 otherwise. The two produce different keys, so
+        installing `blake3` starts a fresh cache.
+
+        Args:
+            fields: The fields from which to derive the key.
+            prefix: A hasher from `hasher` whose fields come before `fields`.
+        """
+        hasher = prefix.copy() if prefix is not None else _new_hasher()
+        _update_hasher(hasher, fields)
+        return hasher.hexdigest()
+
+    def lookup(self, cache_key: CacheKey) -> str | None:
+        """Returns the cached JSON for a call or `None` if there is no entry.
+
+        Args:
+            cache_key: The `CacheKey` of the call.
+        """
+        return self.get(cache_key.key)
+
+    def store(self, cache_key: CacheKey, value: str) -> None:
+        """Stores the JSON `value` for a call.
+
+        Args:
+            cache_key: The `CacheKey` of the call.
+            value: The JSON string to store.
+        """
+        self.set(cache_key.key, value)
+
+    def get(self, key: str) -> str | None:
+        """Returns the cached JSON for `key` or `None` if there is no entry.
+
+        Args:
+            key: The key of the entry.
+        """
+        try:
+            return (self.cache_dir / f"{key}.json").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """Stores the JSON `value` under `key`.
+
+        The entry is first written to a temporary file and then moved into place so
+        that concurrent readers never see a partially written entry.
+
+        Args:
+            key: The key of the entry.
+            value: The JSON string to store.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class SemanticExtractionCache(ExtractionCache):
+    """An `ExtractionCache` that also hits on semantically similar prompts.
+
+    usage docs: learn/response_models.md#semantic-caching
+
+    On an exact miss, the text inputs of the call (its arguments and computed fields)
+    are embedded with `embed` and compared against the entries of calls that match on
+    everything else (prompt, provider, model, call parameters, response model schema,
+    `FromCallArgs` fields, and any images or audio). If the cosine similarity of the
+    nearest entry is at least `threshold`, its JSON is returned instead of calling the
+    provider API. Calls without any text inputs only ever hit exactly.
+
+    Embeddings are stored alongside the exact entries in a `semantic.sqlite3` file in
+    `cache_dir` and searched exhaustively in Python. With 1536-dimensional embeddings
+    each semantic miss costs roughly 75us per entry with the same scope (about 0.75s
+    at 10,000 entries), so this is best suited to caches with up to a few thousand
+    entries per call site.
+
+    Example:
+
+    ```python
+    from mirascope.core import SemanticExtractionCache, openai
+    from openai import OpenAI
+    from pydantic import BaseModel
+
+    client = OpenAI()
+
+
+    def embed(text: str) -> list[float]:
+        response = client.embeddings.create(model="text-embedding-3-small", input=text)
+        return response.data[0].embedding
+
+
+    class Book(BaseModel):
+        title: str
+        author: str
+
+
+    @openai.call(
+        "gpt-4o-mini",
+        response_model=Book,
+        cache=SemanticExtractionCache(embed),
+        call_params={"temperature": 0},
+    )
+    def extract_book(text: str) -> str:
+        return f"Extract {text}"
+
+
+    book = extract_book("The Name of the Wind by Patrick Rothfuss")  # API call
+    book = extract_book("'The Name of the Wind' - Patrick Rothfuss")  # cache hit
+    ```
+    """
+
+    embed: Callable[[str], Sequence[float]]
+    threshold: float
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        cache_dir: str | os.PathLike[str] | None = None,
+        threshold: float = 0.92,
+    ) -> None:
+        """Initializes an instance of `SemanticExtractionCache`.
+
+        Args:
+            embed: The function that returns the embedding of a prompt's text.
+            cache_dir: The directory in which to store cache entries. Defaults to
+                `~/.cache/mirascope`.
+            threshold: The minimum cosine similarity for a semantic hit.
+        """
+        super().__init__(cache_dir)
+        self.embed = embed
+        self.threshold = threshold
+        self._embed = lru_cache(maxsize=128)(embed)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def lookup(self, cache_key: CacheKey) -> str | None:
+        """Returns the cached JSON for the call or its nearest neighbour.
+
+        Args:
+            cache_key: The `CacheKey` of the call.
+        """
+        if (value := self.get(cache_key.key)) is not None or not cache_key.text:
+            return value
+        embedding = self._normalized_embedding(cache_key.text)
+        best_score, best_value = self.threshold, None
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT embedding, value FROM entries WHERE scope = ?",
+                    (cache_key.scope,),
+                )
+                .fetchall()
+            )
+        for blob, value in rows:
+            other = array("d")
+            other.frombytes(blob)
+            if len(other) != len(embedding):
+                continue
+            score = sum(map(operator.mul, embedding, other))
+            if score >= best_score:
+                best_score, best_value = score, value
+        return best_value
+
+    def store(self, cache_key: CacheKey, value: str) -> None:
+        """Stores the JSON `value` for the call and upserts its embedding.
+
+        Args:
+            cache_key: The `CacheKey` of the call.
+            value: The JSON string to store.
+        """
+        self.set(cache_key.key, value)
+        if not cache_key.text:
+            return
+        embedding = self._normalized_embedding(cache_key.text)
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (cache_key.key, cache_key.scope, embedding.tobytes(), value),
+            )
+
+    def _normalized_embedding(self, text: str) -> "array[float]":
+        """Returns the unit-length embedding of `text`."""
+        embedding = array("d", self._embed(text))
+        if norm := math.sqrt(sum(map(operator.mul, embedding, embedding))):
+            return array("d", (value / norm for value in embedding))
+        return embedding
+
+    def _connect(self) -> sqlite3.Connection:
+        """Returns the connection to the embeddings database, opening it on first use.
+
+        The connection is shared by all threads, so callers must hold `self._lock`.
+        """
+        if self._connection is not None:
+            return self._connection
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            self.cache_dir / "semantic.sqlite3", check_same_thread=False
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, scope TEXT NOT NULL, embedding BLOB NOT NULL, "
+            "value TEXT NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_scope ON entries (scope)"
+        )
+        self._connection = connection
+        return connection
@@ -13,6 +13,7 @@ from typing import (
 
 from pydantic import BaseModel
 
+from ._cache import ExtractionCache
 from ._create import create_factory
 from ._extract import extract_factory
 from ._utils import (
@@ -117,6 +118,32 @@ def call_factory(  # noqa: ANN202
         handle_stream_async: The same helper method as `handle_stream` except for
             handling asynchronous streaming.
     """
+    # The provider-specific decorators only depend on the arguments above, so we build
+    # them once here instead of every time the returned `base_call` is invoked.
+    create_decorator = create_factory(
+        TCallResponse=TCallResponse, setup_call=setup_call
+    )
+    stream_decorator = stream_factory(
+        TCallResponse=TCallResponse,
+        TStream=TStream,
+        setup_call=setup_call,
+        handle_stream=handle_stream,
+        handle_stream_async=handle_stream_async,
+    )
+    extract_decorator = extract_factory(
+        TCallResponse=TCallResponse,
+        TToolType=TToolType,
+        setup_call=setup_call,
+        get_json_output=get_json_output,
+    )
+    structured_stream_decorator = structured_stream_factory(
+        TCallResponse=TCallResponse,
+        TCallResponseChunk=TCallResponseChunk,
+        TStream=TStream,
+        TToolType=TToolType,
+        setup_call=setup_call,
+        get_json_output=get_json_output,
+    )
 
     @overload
     def base_call(
@@ -292,6 +319,7 @@ def call_factory(  # noqa: ANN202
         json_mode: bool = False,
         client: _SameSyncAndAsyncClientT | None = None,
         call_params: TCallParams | None = None,
+        cache: ExtractionCache | None = None,
     ) -> LLMFunctionDecorator[TDynamicConfig, _ResponseModelT, _ResponseModelT]: ...
 
     @overload
@@ -305,6 +333,7 @@ def call_factory(  # noqa: ANN202
         json_mode: bool = False,
         client: _AsyncBaseClientT = ...,
         call_params: TCallParams | None = None,
+        cache: ExtractionCache | None = None,
     ) -> AsyncLLMFunctionDecorator[TDynamicConfig, _ResponseModelT]: ...
 
     @overload
@@ -318,6 +347,7 @@ def call_factory(  # noqa: ANN202
         json_mode: bool = False,
         client: _SyncBaseClientT = ...,
         call_params: TCallParams | None = None,
+        cache: ExtractionCache | None = None,
     ) -> SyncLLMFunctionDecorator[TDynamicConfig, _ResponseModelT]: ...
 
     @overload
@@ -331,6 +361,7 @@ def call_factory(  # noqa: ANN202
         json_mode: bool = False,
         client: _SameSyncAndAsyncClientT | None = None,
         call_params: TCallParams | None = None,
+        cache: ExtractionCache | None = None,
     ) -> LLMFunctionDecorator[TDynamicConfig, _ParsedOutputT, _ParsedOutputT]: ...
 
     @overload
@@ -344,6 +375,7 @@ def call_factory(  # noqa: ANN202
         json_mode: bool = False,
         client: _AsyncBaseClientT = ...,
         call_params: TCallParams | None = None,
+        cache: ExtractionCache | None = None,
     ) -> AsyncLLMFunctionDecorator[TDynamicConfig, _ParsedOutputT]: ...
 
     @overload
@@ -357,6 +389,7 @@ def call_factory(  # noqa: ANN202
         json_mode: bool = False,
         client: _SyncBaseClientT = ...,
         call_params: TCallParams | None = None,
+        cache: ExtractionCache | None = None,
     ) -> SyncLLMFunctionDecorator[TDynamicConfig, _ParsedOutputT]: ...
 
     @overload
@@ -434,6 +467,7 @@ def call_factory(  # noqa: ANN202
         | _SyncBaseClientT
         | None = None,
         call_params: TCallParams | None = None,
+        cache: ExtractionCache | None = None,
     ) -> (
         AsyncLLMFunctionDecorator[
             TDynamicConfig,
@@ -468,20 +502,18 @@ def call_factory(  # noqa: ANN202
         if stream and output_parser:
             raise ValueError("Cannot use `output_parser` with `stream=True`.")
 
+        if cache is not None and (not response_model or stream):
+            raise ValueError(
+                "Cannot use `cache` without `response_model` or with `stream=True`."
+            )
+
         if call_params is None:
             call_params = default_call_params
 
         if response_model:
             if stream:
                 return partial(
-                    structured_stream_factory(
-                        TCallResponse=TCallResponse,
-                        TCallResponseChunk=TCallResponseChunk,
-                        TStream=TStream,
-                        TToolType=TToolType,
-                        setup_call=setup_call,
-                        get_json_output=get_json_output,
-                    ),
+                    structured_stream_decorator,
                     model=model,
                     response_model=response_model,
                     json_mode=json_mode,
@@ -490,29 +522,19 @@ def call_factory(  # noqa: ANN202
                 )  # pyright: ignore [reportReturnType, reportCallIssue]
             else:
                 return partial(
-                    extract_factory(
-                        TCallResponse=TCallResponse,
-                        TToolType=TToolType,
-                        setup_call=setup_call,
-                        get_json_output=get_json_output,
-                    ),
+                    extract_decorator,
                     model=model,
                     response_model=response_model,
                     output_parser=output_parser,
                     json_mode=json_mode,
                     client=client,
                     call_params=call_params,
+                    cache=cache,
                 )  # pyright: ignore [reportCallIssue]
 
         if stream:
             return partial(
-                stream_factory(
-                    TCallResponse=TCallResponse,
-                    TStream=TStream,
-                    setup_call=setup_call,
-                    handle_stream=handle_stream,
-                    handle_stream_async=handle_stream_async,
-                ),
+                stream_decorator,
                 model=model,
                 tools=tools,
                 json_mode=json_mode,
@@ -520,7 +542,7 @@ def call_factory(  # noqa: ANN202
                 call_params=call_params,
             )  # pyright: ignore [reportReturnType, reportCallIssue]
         return partial(
-            create_factory(TCallResponse=TCallResponse, setup_call=setup_call),
+            create_decorator,
             model=model,
             tools=tools,
             output_parser=output_parser,
@@ -150,12 +150,9 @@ def create_factory(  # noqa: ANN202
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         if fn_is_async(fn):
 
-            @wraps(fn)
-            async def inner_async(
-                *args: _P.args, **kwargs: _P.kwargs
+            async def create_with_dynamic_config_async(
+                fn_args: dict[str, Any], dynamic_config: _BaseDynamicConfigT
             ) -> TCallResponse | _ParsedOutputT:
-                fn_args = get_fn_args(fn, args, kwargs)
-                dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
                 create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
                     model=model,
                     client=client,  # pyright: ignore [reportArgumentType]
@@ -187,15 +184,22 @@ def create_factory(  # noqa: ANN202
                 output._model = model
                 return output if not output_parser else output_parser(output)
 
+            @wraps(fn)
+            async def inner_async(
+                *args: _P.args, **kwargs: _P.kwargs
+            ) -> TCallResponse | _ParsedOutputT:
+                return await create_with_dynamic_config_async(
+                    get_fn_args(fn, args, kwargs),
+                    await get_dynamic_configuration(fn, args, kwargs),
+                )
+
+            inner_async._create_with_dynamic_config = create_with_dynamic_config_async  # pyright: ignore [reportFunctionMemberAccess]
             return inner_async
         else:
 
-            @wraps(fn)
-            def inner(
-                *args: _P.args, **kwargs: _P.kwargs
+            def create_with_dynamic_config(
+                fn_args: dict[str, Any], dynamic_config: _BaseDynamicConfigT
             ) -> TCallResponse | _ParsedOutputT:
-                fn_args = get_fn_args(fn, args, kwargs)
-                dynamic_config = get_dynamic_configuration(fn, args, kwargs)
                 create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
                     model=model,
                     client=client,  # pyright: ignore [reportArgumentType]
@@ -227,6 +231,16 @@ def create_factory(  # noqa: ANN202
                 output._model = model
                 return output if not output_parser else output_parser(output)
 
+            @wraps(fn)
+            def inner(
+                *args: _P.args, **kwargs: _P.kwargs
+            ) -> TCallResponse | _ParsedOutputT:
+                return create_with_dynamic_config(
+                    get_fn_args(fn, args, kwargs),
+                    get_dynamic_configuration(fn, args, kwargs),
+                )
+
+            inner._create_with_dynamic_config = create_with_dynamic_config  # pyright: ignore [reportFunctionMemberAccess]
             return inner
 
     return decorator
@@ -1,11 +1,13 @@
 """The `extract_factory` method for generating provider specific create decorators."""
 
+import json
 from collections.abc import Awaitable, Callable
 from functools import wraps
 from typing import ParamSpec, TypeVar, overload
 
 from pydantic import BaseModel, ValidationError
 
+from ._cache import ExtractionCache
 from ._create import create_factory
 from ._utils import (
     BaseType,
@@ -14,12 +16,17 @@ from ._utils import (
     SetupCall,
     extract_tool_return,
     fn_is_async,
+    get_dynamic_configuration,
+    get_fn_args,
+    is_prompt_template,
     setup_extract_tool,
 )
+from ._utils._get_cache_key import get_cache_key
 from ._utils._get_fields_from_call_args import get_fields_from_call_args
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
 from .dynamic_config import BaseDynamicConfig
+from .prompt import prompt_template
 from .tool import BaseTool
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
@@ -79,6 +86,7 @@ def extract_factory(  # noqa: ANN202
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        cache: ExtractionCache | None = None,
     ) -> Callable[_P, _ResponseModelT | _ParsedOutputT]: ...
 
     @overload
@@ -90,6 +98,7 @@ def extract_factory(  # noqa: ANN202
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        cache: ExtractionCache | None = None,
     ) -> Callable[_P, Awaitable[_ResponseModelT | _ParsedOutputT]]: ...
 
     def decorator(
@@ -101,20 +110,30 @@ def extract_factory(  # noqa: ANN202
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        cache: ExtractionCache | None = None,
     ) -> Callable[
         _P,
         _ResponseModelT | _ParsedOutputT | Awaitable[_ResponseModelT | _ParsedOutputT],
     ]:
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         tool = setup_extract_tool(response_model, TToolType)
-        create_decorator_kwargs = {
-            "model": model,
-            "tools": [tool],
-            "output_parser": None,
-            "json_mode": json_mode,
-            "client": client,
-            "call_params": call_params,
-        }
+        create_fn = create_decorator(
+            fn=fn,
+            model=model,
+            tools=[tool],
+            output_parser=None,
+            json_mode=json_mode,
+            client=client,
+            call_params=call_params,
+        )
+        if cache is not None:
+            prompt_fn = fn if is_prompt_template(fn) else prompt_template()(fn)  # pyright: ignore [reportArgumentType]
+            static_key = ExtractionCache.hasher(
+                TCallResponse._provider,
+                model,
+                str(json_mode),
+                json.dumps(tool.model_json_schema(), sort_keys=True),
+            )
 
         if fn_is_async(fn):
 
@@ -125,9 +144,32 @@ def extract_factory(  # noqa: ANN202
                 fields_from_call_args = get_fields_from_call_args(
                     response_model, fn, args, kwargs
                 )
-                call_response = await create_decorator(
-                    fn=fn, **create_decorator_kwargs
-                )(*args, **kwargs)
+                cache_key = None
+                if cache is None:
+                    call_response = await create_fn(*args, **kwargs)
+                else:
+                    # Render the prompt once for both the cache key and the call
+                    fn_args = get_fn_args(prompt_fn, args, kwargs)
+                    dynamic_config = await get_dynamic_configuration(
+                        prompt_fn, args, kwargs
+                    )
+                    cache_key = get_cache_key(
+                        fn=prompt_fn,
+                        fn_args=fn_args,
+                        dynamic_config=dynamic_config,
+                        tool_type=TToolType,
+                        call_params=call_params,
+                        fields_from_call_args=fields_from_call_args,
+                        static_key=static_key,
+                    )
+                    if (cached := cache.lookup(cache_key)) is not None:
+                        output = extract_tool_return(
+                            response_model, cached, False, fields_from_call_args
+                        )
+                        return output if not output_parser else output_parser(output)  # pyright: ignore [reportArgumentType, reportReturnType]
+                    call_response = await create_fn._create_with_dynamic_config(  # pyright: ignore [reportFunctionMemberAccess]
+                        fn_args, dynamic_config
+                    )
                 json_output = get_json_output(call_response, json_mode)
                 try:
                     output = extract_tool_return(
@@ -138,6 +180,8 @@ def extract_factory(  # noqa: ANN202
                     raise e
                 if isinstance(output, BaseModel):
                     output._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
+                if cache is not None and cache_key is not None:
+                    cache.store(cache_key, json_output)
                 return output if not output_parser else output_parser(output)  # pyright: ignore [reportArgumentType, reportReturnType]
 
             return inner_async
@@ -148,9 +192,30 @@ def extract_factory(  # noqa: ANN202
                 fields_from_call_args = get_fields_from_call_args(
                     response_model, fn, args, kwargs
                 )
-                call_response = create_decorator(fn=fn, **create_decorator_kwargs)(
-                    *args, **kwargs
-                )
+                cache_key = None
+                if cache is None:
+                    call_response = create_fn(*args, **kwargs)
+                else:
+                    # Render the prompt once for both the cache key and the call
+                    fn_args = get_fn_args(prompt_fn, args, kwargs)
+                    dynamic_config = get_dynamic_configuration(prompt_fn, args, kwargs)
+                    cache_key = get_cache_key(
+                        fn=prompt_fn,
+                        fn_args=fn_args,
+                        dynamic_config=dynamic_config,
+                        tool_type=TToolType,
+                        call_params=call_params,
+                        fields_from_call_args=fields_from_call_args,
+                        static_key=static_key,
+                    )
+                    if (cached := cache.lookup(cache_key)) is not None:
+                        output = extract_tool_return(
+                            response_model, cached, False, fields_from_call_args
+                        )
+                        return output if not output_parser else output_parser(output)  # pyright: ignore [reportArgumentType, reportReturnType]
+                    call_response = create_fn._create_with_dynamic_config(  # pyright: ignore [reportFunctionMemberAccess]
+                        fn_args, dynamic_config
+                    )
                 json_output = get_json_output(call_response, json_mode)
                 try:
                     output = extract_tool_return(
@@ -161,6 +226,8 @@ def extract_factory(  # noqa: ANN202
                     raise e
                 if isinstance(output, BaseModel):
                     output._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
+                if cache is not None and cache_key is not None:
+                    cache.store(cache_key, json_output)
                 return output if not output_parser else output_parser(output)  # pyright: ignore [reportReturnType, reportArgumentType]
 
             return inner
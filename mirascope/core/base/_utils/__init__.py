@@ -9,6 +9,7 @@ from ._extract_tool_return import extract_tool_return
 from ._format_template import format_template
 from ._get_audio_type import get_audio_type
 from ._get_create_fn_or_async_create_fn import get_async_create_fn, get_create_fn
+from ._get_default_client import get_default_client
 from ._get_dynamic_configuration import get_dynamic_configuration
 from ._get_fn_args import get_fn_args
 from ._get_image_type import get_image_type
@@ -21,6 +21,12 @@ def extract_tool_return(
     allow_partial: bool,
     fields_from_call_args: dict[str, Any],
 ) -> _ResponseModelT:
+    if isinstance(json_output, str) and not allow_partial and not fields_from_call_args:
+        # Parse and validate the raw JSON in a single pass
+        if is_base_type(response_model):
+            temp_model = convert_base_type_to_base_tool(response_model, BaseModel)
+            return temp_model.model_validate_json(json_output).value  # pyright: ignore [reportAttributeAccessIssue]
+        return response_model.model_validate_json(json_output)
     json_obj = (
         jiter.from_json(
             json_output.encode(),
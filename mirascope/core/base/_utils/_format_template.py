@@ -1,12 +1,23 @@
 """This module contains the `format_template` function."""
 
 import inspect
+from functools import lru_cache
 from typing import Any
 
 from ._get_template_values import get_template_values
 from ._get_template_variables import get_template_variables
 
 
+@lru_cache(maxsize=1024)
+def _prepare_template(template: str) -> tuple[str, str]:
+    """Returns the dedented `template` and the version of it that can be formatted."""
+    dedented_template = inspect.cleandoc(template).strip()
+    # Remove any special format specs that are actually invalid normally
+    return dedented_template, dedented_template.replace(":lists", "").replace(
+        ":list", ""
+    )
+
+
 def format_template(template: str, attrs: dict[str, Any]) -> str:
     """Formats the given prompt `template`
 
@@ -18,12 +29,9 @@ def format_template(template: str, attrs: dict[str, Any]) -> str:
         The formatted template.
 
     """
-    dedented_template = inspect.cleandoc(template).strip()
+    dedented_template, format_ready_template = _prepare_template(template)
     template_vars = get_template_variables(dedented_template, True)
 
     values = get_template_values(template_vars, attrs)
 
-    # Remove any special format specs that are actually invalid normally
-    dedented_template = dedented_template.replace(":lists", "").replace(":list", "")
-
-    return dedented_template.format(**values).strip()
+    return format_ready_template.format_map(values).strip()
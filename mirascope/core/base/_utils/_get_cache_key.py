@@ -0,0 +1,109 @@
+"""This module contains the `get_cache_key` function."""
+
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from .._cache import CacheKey, ExtractionCache, KeyHasher
+from ..call_params import BaseCallParams
+from ..dynamic_config import BaseDynamicConfig
+from ..message_param import BaseMessageParam, TextPart
+from ..tool import BaseTool
+from ._setup_call import setup_call
+
+
+def _dump_models(value: Any) -> Any:  # noqa: ANN401
+    """Returns `value` with any nested models dumped to Python objects."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, list | tuple):
+        return [_dump_models(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _dump_models(item) for key, item in value.items()}
+    return value
+
+
+def _is_binary(value: Any) -> bool:  # noqa: ANN401
+    """Returns whether `value` is binary data (e.g. an image) or a list of it."""
+    if isinstance(value, list | tuple):
+        return bool(value) and all(_is_binary(item) for item in value)
+    return isinstance(value, bytes | bytearray)
+
+
+def _to_json(value: Any) -> bytes:  # noqa: ANN401
+    """Returns the JSON of `value` with any bytes (e.g. images) base64 encoded.
+
+    Models serialize their bytes fields as UTF-8 regardless of `bytes_mode`, so we dump
+    them to Python objects first.
+    """
+    return to_json(_dump_models(value), bytes_mode="base64", serialize_unknown=True)
+
+
+def get_cache_key(
+    *,
+    fn: Callable,
+    fn_args: dict[str, Any],
+    dynamic_config: BaseDynamicConfig,
+    tool_type: type[BaseTool],
+    call_params: BaseCallParams,
+    fields_from_call_args: dict[str, Any],
+    static_key: KeyHasher,
+) -> CacheKey:
+    """Returns the `CacheKey` for a call.
+
+    The messages and call kwargs are rendered provider-agnostically so that the key
+    reflects exactly what would be sent to the provider. The scope covers the prompt
+    itself (the function and its template) along with everything but the variable
+    text inputs of the call, which are kept separately as text for semantic lookups.
+    Binary inputs (e.g. images or audio) can't be embedded, so they're part of the scope.
+
+    Args:
+        fn: The prompt function of the call.
+        fn_args: The arguments of the call bound to `fn`'s signature.
+        dynamic_config: The dynamic configuration of the call.
+        tool_type: The provider-specific `BaseTool` type.
+        call_params: The call parameters of the call.
+        fields_from_call_args: The `FromCallArgs` fields passed to the response model.
+        static_key: A hasher seeded at decoration time with the fields that are fixed
+            for the call (e.g. the provider, model, and response model schema).
+
+    Returns:
+        The cache key.
+    """
+    computed_fields = dynamic_config.get("computed_fields") if dynamic_config else None
+    text_inputs: list[str] = []
+    binary_inputs: list[Any] = []
+    for value in (fn_args | (computed_fields or {})).values():
+        if _is_binary(value):
+            binary_inputs.append(value)
+        else:
+            text_inputs.append(
+                value if isinstance(value, str) else _to_json(value).decode()
+            )
+    prompt_template, messages, _, call_kwargs = setup_call(
+        fn, fn_args, dynamic_config, None, tool_type, call_params
+    )
+    non_text_content: list[Any] = []
+    for message in messages:
+        if not isinstance(message, BaseMessageParam):
+            non_text_content.append(message)
+        elif not isinstance(message.content, str):
+            non_text_content.append(
+                [part for part in message.content if not isinstance(part, TextPart)]
+            )
+    scope = ExtractionCache.key(
+        f"{fn.__module__}.{fn.__qualname__}",
+        prompt_template or "",
+        _to_json(call_kwargs),
+        _to_json(fields_from_call_args),
+        _to_json(non_text_content),
+        _to_json(binary_inputs),
+        prefix=static_key,
+    )
+    return CacheKey(
+        key=ExtractionCache.key(scope, _to_json(messages)),
+        scope=scope,
+        text="\n\n".join(text_inputs),
+    )
@@ -0,0 +1,27 @@
+"""This module contains the `get_default_client` function."""
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+_ClientT = TypeVar("_ClientT")
+
+_clients: dict[Callable[[], Any], Any] = {}
+
+
+def get_default_client(client_type: Callable[[], _ClientT]) -> _ClientT:
+    """Returns a shared instance of the sync `client_type` for calls without a `client`.
+
+    Every client owns its own connection pool, so constructing a new client per call
+    means every call pays for a fresh TCP and TLS handshake. We instead construct each
+    default client once and reuse it. Async clients are bound to the event loop they're
+    first used on and hold on to it, so those are still constructed per call.
+
+    Args:
+        client_type: The zero-argument sync client constructor (e.g. `OpenAI`).
+
+    Returns:
+        The shared client instance.
+    """
+    if (client := _clients.get(client_type)) is None:
+        client = _clients[client_type] = client_type()
+    return client
@@ -1,9 +1,20 @@
 """This module provides a function to get the variables in a template string."""
 
+from functools import lru_cache
 from string import Formatter
 from typing import Literal, overload
 
 
+@lru_cache(maxsize=1024)
+def _parse_template(template: str) -> tuple[tuple[str, str], ...]:
+    """Returns the `(variable, format_spec)` pairs in `template`, cached per string."""
+    return tuple(
+        (var, format_spec)
+        for _, var, format_spec, _ in Formatter().parse(template)
+        if var
+    )
+
+
 @overload
 def get_template_variables(
     template: str, include_format_spec: Literal[True]
@@ -29,10 +40,6 @@ def get_template_variables(
         The variables in the template string.
     """
     if include_format_spec:
-        return [
-            (var, format_spec)
-            for _, var, format_spec, _ in Formatter().parse(template)
-            if var
-        ]
+        return list(_parse_template(template))
     else:
-        return [var for _, var, _, _ in Formatter().parse(template) if var]
+        return [var for var, _ in _parse_template(template)]
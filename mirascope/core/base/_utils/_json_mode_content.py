@@ -1,10 +1,12 @@
 """A function generating content to request JSON mode from models without it."""
 
 import json
+from functools import lru_cache
 
 from ..tool import BaseTool, GenerateJsonSchemaNoTitles
 
 
+@lru_cache(maxsize=1024)
 def json_mode_content(tool_type: type[BaseTool] | None) -> str:
     """Returns the content to request JSON mode from models without it."""
     if not tool_type:
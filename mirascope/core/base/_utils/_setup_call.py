@@ -5,6 +5,7 @@ from collections.abc import (
     Awaitable,
     Callable,
 )
+from copy import deepcopy
 from typing import (
     Any,
     TypeVar,
@@ -24,6 +25,33 @@ _BaseToolT = TypeVar("_BaseToolT", bound=BaseTool)
 _BaseDynamicConfigT = TypeVar("_BaseDynamicConfigT", bound=BaseDynamicConfig)
 
 
+def _convert_tool(
+    tool: type[BaseTool] | Callable, tool_type: type[_BaseToolT]
+) -> tuple[type[_BaseToolT], Any]:
+    """Returns the converted `tool_type` for `tool` along with its tool schema.
+
+    Converting a tool creates a new model class and generating its schema walks the
+    model graph, so we only do both once per tool class. We store the results on the
+    class itself so that they are released along with it, and return a copy of the
+    schema since it ends up in the caller's `call_kwargs`. Function tools are often
+    closures or bound methods, so we convert those on every call instead of holding on
+    to them.
+    """
+    if not inspect.isclass(tool):
+        converted_tool_type = convert_function_to_base_tool(tool, tool_type)
+        return converted_tool_type, converted_tool_type.tool_schema()
+    if (converted_tools := tool.__dict__.get("__mirascope_converted_tools__")) is None:
+        converted_tools = tool.__mirascope_converted_tools__ = {}  # pyright: ignore [reportAttributeAccessIssue]
+    if (converted := converted_tools.get(tool_type)) is None:
+        converted_tool_type = convert_base_model_to_base_tool(tool, tool_type)
+        converted = converted_tools[tool_type] = (
+            converted_tool_type,
+            converted_tool_type.tool_schema(),
+        )
+    converted_tool_type, tool_schema = converted
+    return converted_tool_type, deepcopy(tool_schema)
+
+
 def setup_call(
     fn: Callable[..., _BaseDynamicConfigT | Awaitable[_BaseDynamicConfigT]]
     | Callable[..., list[BaseMessageParam]]
@@ -60,12 +88,8 @@ def setup_call(
 
     tool_types = None
     if tools:
-        tool_types = [
-            convert_base_model_to_base_tool(tool, tool_type)
-            if inspect.isclass(tool)
-            else convert_function_to_base_tool(tool, tool_type)
-            for tool in tools
-        ]
-        call_kwargs["tools"] = [tool_type.tool_schema() for tool_type in tool_types]
+        converted_tools = [_convert_tool(tool, tool_type) for tool in tools]
+        tool_types = [converted_tool_type for converted_tool_type, _ in converted_tools]
+        call_kwargs["tools"] = [tool_schema for _, tool_schema in converted_tools]
 
     return prompt_template, messages, tool_types, call_kwargs
@@ -1,6 +1,7 @@
 """This module contains the base classes for streaming responses from LLMs."""
 
 import datetime
+import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator
 from functools import wraps
@@ -52,6 +53,40 @@ _FinishReason = TypeVar("_FinishReason")
 _DEFAULT = object()
 
 
+class _ContentBatcher:
+    """Coalesces streamed content into batches of growing size."""
+
+    def __init__(
+        self, max_batch_size: int, flush_interval: float, growth_factor: int
+    ) -> None:
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.growth_factor = growth_factor
+        self.batch: list[str] = []
+        self.batch_size = 1
+        self.last_flush = time.monotonic()
+
+    def add(self, content: str) -> str | None:
+        """Adds `content` to the batch and returns the batch if it should be flushed."""
+        if content:
+            self.batch.append(content)
+        if self.batch and (
+            len(self.batch) >= self.batch_size
+            or time.monotonic() - self.last_flush >= self.flush_interval
+        ):
+            self.batch_size = min(
+                self.batch_size * self.growth_factor, self.max_batch_size
+            )
+            return self.flush()
+        return None
+
+    def flush(self) -> str | None:
+        """Returns the joined batch (if any) and starts a new one."""
+        content = "".join(self.batch) if self.batch else None
+        self.batch, self.last_flush = [], time.monotonic()
+        return content
+
+
 class BaseStream(
     Generic[
         _BaseCallResponseT,
@@ -180,6 +215,47 @@ class BaseStream(
 
         return generator()
 
+    def batched_content(
+        self,
+        max_batch_size: int = 50,
+        flush_interval: float = 0.02,
+        growth_factor: int = 3,
+    ) -> Generator[str, None, None]:
+        """Iterates over the stream, yielding the content of batches of chunks.
+
+        The first batch contains a single chunk so that the time to first token is the
+        same as iterating over the stream directly. Each subsequent batch can hold
+        `growth_factor` times as many chunks up to `max_batch_size`, and a batch is
+        flushed as soon as a chunk arrives `flush_interval` seconds after the last
+        flush. This reduces per-chunk overhead when forwarding long streams (e.g. over
+        a websocket). Tools are still collected for `message_param` but not yielded.
+
+        Args:
+            max_batch_size: The maximum number of chunks in a batch.
+            flush_interval: The number of seconds after which a batch is flushed.
+            growth_factor: The factor by which the batch size grows after each flush.
+        """
+        batcher = _ContentBatcher(max_batch_size, flush_interval, growth_factor)
+        for chunk, _ in self:
+            if (content := batcher.add(chunk.content)) is not None:
+                yield content
+        if (content := batcher.flush()) is not None:
+            yield content
+
+    async def batched_content_async(
+        self,
+        max_batch_size: int = 50,
+        flush_interval: float = 0.02,
+        growth_factor: int = 3,
+    ) -> AsyncGenerator[str, None]:
+        """Same as `batched_content` but for asynchronous streams."""
+        batcher = _ContentBatcher(max_batch_size, flush_interval, growth_factor)
+        async for chunk, _ in self:
+            if (content := batcher.add(chunk.content)) is not None:
+                yield content
+        if (content := batcher.flush()) is not None:
+            yield content
+
     def _update_properties(self, chunk: _BaseCallResponseChunkT) -> None:
         """Updates the properties of the stream."""
         self.content += chunk.content
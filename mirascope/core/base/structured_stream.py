@@ -8,7 +8,7 @@ from collections.abc import (
     Generator,
     Iterable,
 )
-from functools import wraps
+from functools import cache, wraps
 from typing import (
     Any,
     Generic,
@@ -135,6 +135,27 @@ _AsyncResponseChunkT = TypeVar("_AsyncResponseChunkT")
 _P = ParamSpec("_P")
 
 
+@cache
+def _custom_content_chunk_type(
+    TCallResponseChunk: type[_BaseCallResponseChunkT],
+) -> type[_BaseCallResponseChunkT]:
+    """Returns a `TCallResponseChunk` subclass whose `content` is its `json_output`.
+
+    Defining a Pydantic model builds its core schema, which is slow, so we only define
+    this model the first time a provider's structured streams are used rather than when
+    the provider is imported.
+    """
+
+    class CustomContentChunk(TCallResponseChunk):
+        json_output: str
+
+        @property
+        def content(self) -> str:
+            return self.json_output
+
+    return CustomContentChunk
+
+
 def structured_stream_factory(  # noqa: ANN201
     *,
     TCallResponse: type[_BaseCallResponseT],
@@ -164,13 +185,6 @@ def structured_stream_factory(  # noqa: ANN201
     ],
     get_json_output: GetJsonOutput[_BaseCallResponseChunkT],
 ):
-    class CustomContentChunk(TCallResponseChunk):
-        json_output: str
-
-        @property
-        def content(self) -> str:
-            return self.json_output
-
     @overload
     def decorator(
         fn: Callable[_P, _BaseDynamicConfigT],
@@ -209,6 +223,8 @@ def structured_stream_factory(  # noqa: ANN201
         _P,
         Iterable[_ResponseModelT] | Awaitable[AsyncIterable[_ResponseModelT]],
     ]:
+        CustomContentChunk = _custom_content_chunk_type(TCallResponseChunk)
+
         def handle_chunk(
             chunk: _ResponseChunkT | _AsyncResponseChunkT,
         ) -> tuple[_BaseCallResponseChunkT, None]:
@@ -244,13 +260,14 @@ def structured_stream_factory(  # noqa: ANN201
         )
 
         tool = setup_extract_tool(response_model, TToolType)
-        stream_decorator_kwargs = {
-            "model": model,
-            "tools": [tool],
-            "json_mode": json_mode,
-            "client": client,
-            "call_params": call_params,
-        }
+        stream_fn = stream_decorator(
+            fn=fn,
+            model=model,
+            tools=[tool],
+            json_mode=json_mode,
+            client=client,
+            call_params=call_params,
+        )
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         if fn_is_async(fn):
 
@@ -262,9 +279,7 @@ def structured_stream_factory(  # noqa: ANN201
                     response_model, fn, args, kwargs
                 )
                 return BaseStructuredStream[_ResponseModelT](
-                    stream=await stream_decorator(fn=fn, **stream_decorator_kwargs)(
-                        *args, **kwargs
-                    ),
+                    stream=await stream_fn(*args, **kwargs),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
                 )
@@ -278,9 +293,7 @@ def structured_stream_factory(  # noqa: ANN201
                     response_model, fn, args, kwargs
                 )
                 return BaseStructuredStream[_ResponseModelT](
-                    stream=stream_decorator(fn=fn, **stream_decorator_kwargs)(
-                        *args, **kwargs
-                    ),
+                    stream=stream_fn(*args, **kwargs),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
                 )
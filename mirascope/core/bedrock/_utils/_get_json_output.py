@@ -1,6 +1,6 @@
 """Get the JSON output from a completion response."""
 
-import json
+from pydantic_core import to_json
 
 from ..call_response import BedrockCallResponse
 from ..call_response_chunk import BedrockCallResponseChunk
@@ -16,7 +16,7 @@ def get_json_output(
         elif message := response.message:
             tool_calls = [t for c in message["content"] if (t := c.get("toolUse"))]
             if tool_calls and (tool_call_input := tool_calls[0].get("input", {})):
-                return json.dumps(tool_call_input)
+                return to_json(tool_call_input).decode()
         raise ValueError("No tool call or JSON object found in response.")
     else:
         if json_mode:
@@ -1,8 +1,8 @@
 """Handles the stream of completion chunks."""
 
-import json
 from collections.abc import AsyncGenerator, Generator
 
+import jiter
 from mypy_boto3_bedrock_runtime.type_defs import (
     ToolUseBlockOutputTypeDef,
 )
@@ -62,7 +62,9 @@ def _handle_chunk(
                 current_tool_use = ToolUseBlockContentTypeDef(
                     toolUse=ToolUseBlockOutputTypeDef(
                         toolUseId=current_tool_use_chunk["tool_use_id"],
-                        input=json.loads(current_tool_use_chunk["input_chunk"]),
+                        input=jiter.from_json(
+                            current_tool_use_chunk["input_chunk"].encode()
+                        ),
                         name=current_tool_use_chunk["name"],
                     )
                 )
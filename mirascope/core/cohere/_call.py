@@ -61,6 +61,8 @@ Args:
         call response.
     json_mode (bool): Whether to use JSON Mode.
     client (object): An optional custom client to use in place of the default client.
+    cache (ExtractionCache): An optional cache for extracted response models. Requires
+        `response_model` and `stream=False`.
     call_params (CohereCallParams): The `CohereCallParams` call parameters to use in the
         API call.
 
@@ -1,8 +1,7 @@
 """Get the JSON output from a completion response."""
 
-import json
-
 from cohere.types import StreamedChatResponse_ToolCallsGeneration
+from pydantic_core import to_json
 
 from ..call_response import CohereCallResponse
 from ..call_response_chunk import CohereCallResponseChunk
@@ -16,7 +15,7 @@ def get_json_output(
         if json_mode and response.content:
             return response.content
         elif response.response.tool_calls:
-            return json.dumps(response.response.tool_calls[0].parameters)
+            return to_json(response.response.tool_calls[0].parameters).decode()
         raise ValueError("No tool call or JSON object found in response.")
     else:
         # raise ValueError("Cohere does not support structured streaming... :(")
@@ -27,5 +26,5 @@ def get_json_output(
             and (tool_calls := response.chunk.tool_calls)
             and (parameters := tool_calls[0].parameters)
         ):
-            return json.dumps(parameters)
+            return to_json(parameters).decode()
         return ""
@@ -128,7 +128,11 @@ def setup_call(
     }
 
     if client is None:
-        client = AsyncClient() if inspect.iscoroutinefunction(fn) else Client()
+        client = (
+            AsyncClient()
+            if inspect.iscoroutinefunction(fn)
+            else _utils.get_default_client(Client)
+        )
 
     create_or_stream = (
         get_async_create_fn(client.chat, client.chat_stream)
@@ -61,6 +61,8 @@ Args:
         original call response.
     json_modem (bool): Whether to use JSON Mode.
     client (object): An optional custom client to use in place of the default client.
+    cache (ExtractionCache): An optional cache for extracted response models. Requires
+        `response_model` and `stream=False`.
     call_params (GeminiCallParams): The `GeminiCallParams` call parameters to use in the
         API call.
 
@@ -1,8 +1,7 @@
 """Get JSON output from a Gemini response."""
 
-import json
-
 from proto.marshal.collections import RepeatedComposite
+from pydantic_core import to_json
 
 from ..call_response import GeminiCallResponse
 from ..call_response_chunk import GeminiCallResponseChunk
@@ -20,12 +19,12 @@ def get_json_output(
             for part in response.response.parts
             if part.function_call.args
         ]:
-            return json.dumps(
+            return to_json(
                 {
                     k: v if not isinstance(v, RepeatedComposite) else list(v)
                     for k, v in tool_calls[0].args.items()
                 }
-            )
+            ).decode()
         else:
             raise ValueError("No tool call or JSON object found in response.")
     elif not json_mode:
@@ -111,7 +111,11 @@ def setup_call(
     call_kwargs |= {"model": model, "messages": messages}
 
     if client is None:
-        client = AsyncGroq() if inspect.iscoroutinefunction(fn) else Groq()
+        client = (
+            AsyncGroq()
+            if inspect.iscoroutinefunction(fn)
+            else _utils.get_default_client(Groq)
+        )
 
     create = (
         get_async_create_fn(client.chat.completions.create)
@@ -63,6 +63,8 @@ Args:
         call response.
     json_mode (bool): Whether to use JSON Mode.
     client (None): LiteLLM does not support a custom client.
+    cache (ExtractionCache): An optional cache for extracted response models. Requires
+        `response_model` and `stream=False`.
     call_params (OpenAICallParams): The `OpenAICallParams` call parameters to use in the
         API call.
 
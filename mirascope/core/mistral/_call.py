@@ -59,6 +59,8 @@ Args:
         parsing the call response whose value will be returned in place of the original call response.
     json_mode (bool): Whether to use JSON Mode.
     client (object): An optional custom client to use in place of the default client.
+    cache (ExtractionCache): An optional cache for extracted response models. Requires
+        `response_model` and `stream=False`.
     call_params (MistralCallParams): The `MistralCallParams` call parameters to use in
         the API call.
 
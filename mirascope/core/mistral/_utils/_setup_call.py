@@ -113,7 +113,9 @@ def setup_call(
 
     if client is None:
         client = (
-            MistralAsyncClient() if inspect.iscoroutinefunction(fn) else MistralClient()
+            MistralAsyncClient()
+            if inspect.iscoroutinefunction(fn)
+            else _utils.get_default_client(MistralClient)
         )
     if isinstance(client, MistralAsyncClient):
         create_or_stream = get_async_create_fn(client.chat, client.chat_stream)
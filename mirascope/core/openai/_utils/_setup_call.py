@@ -124,7 +124,11 @@ def setup_call(
     call_kwargs |= {"model": model, "messages": messages}
 
     if client is None:
-        client = AsyncOpenAI() if inspect.iscoroutinefunction(fn) else OpenAI()
+        client = (
+            AsyncOpenAI()
+            if inspect.iscoroutinefunction(fn)
+            else _utils.get_default_client(OpenAI)
+        )
     create = (
         get_async_create_fn(client.chat.completions.create)
         if isinstance(client, AsyncOpenAI)
@@ -56,6 +56,8 @@ Args:
         original call response.
     json_modem (bool): Whether to use JSON Mode.
     client (object): An optional custom client to use in place of the default client.
+    cache (ExtractionCache): An optional cache for extracted response models. Requires
+        `response_model` and `stream=False`.
     call_params (VertexCallParams): The `VertexCallParams` call parameters to use in the
         API call.
 
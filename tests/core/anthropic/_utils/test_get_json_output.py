@@ -69,7 +69,7 @@ def test_get_json_output_call_response() -> None:
 
     assert (
         get_json_output(call_response, json_mode=False)
-        == '{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}'
+        == '{"title":"The Name of the Wind","author":"Patrick Rothfuss"}'
     )
 
     completion.content[0] = ToolUseBlock(
@@ -8,6 +8,7 @@ from anthropic import Anthropic
 
 from mirascope.core.anthropic._utils._setup_call import setup_call
 from mirascope.core.anthropic.tool import AnthropicTool
+from mirascope.core.base._utils import get_default_client
 
 
 @pytest.fixture()
@@ -30,6 +31,7 @@ def test_setup_call(
 ) -> None:
     """Tests the `setup_call` function."""
     mock_utils.setup_call = mock_base_setup_call
+    mock_utils.get_default_client = get_default_client
     mock_base_setup_call.return_value[3] = {"max_tokens": 1000}
     fn = MagicMock()
     create, prompt_template, messages, tool_types, call_kwargs = setup_call(
@@ -2,7 +2,8 @@
 
 from typing import Annotated
 
-from pydantic import BaseModel, RootModel
+import pytest
+from pydantic import BaseModel, RootModel, ValidationError
 
 from mirascope.core.base._utils._extract_tool_return import extract_tool_return
 from mirascope.core.base.from_call_args import FromCallArgs
@@ -30,6 +31,19 @@ def test_extract_tool_return() -> None:
     assert book.author is None
 
 
+def test_extract_tool_return_invalid_json() -> None:
+    """Tests that invalid JSON raises a `ValidationError` when parsing directly."""
+
+    class Book(BaseModel):
+        title: str
+        author: str
+
+    with pytest.raises(ValidationError):
+        extract_tool_return(
+            Book, '{"title": "The Name', allow_partial=False, fields_from_call_args={}
+        )
+
+
 def test_extract_tool_return_base_type() -> None:
     """Tests the `extract_tool_return` function with a base type."""
 
@@ -48,6 +62,18 @@ def test_extract_tool_return_base_type() -> None:
     assert title == "The Name"
 
 
+def test_extract_tool_return_base_type_from_obj() -> None:
+    """Tests the `extract_tool_return` function with a base type and parsed output."""
+
+    titles = extract_tool_return(
+        list[str],
+        {"value": ["The Name of the Wind", "The Wise Man's Fear"]},
+        allow_partial=False,
+        fields_from_call_args={},
+    )
+    assert titles == ["The Name of the Wind", "The Wise Man's Fear"]
+
+
 def test_extract_tool_return_parse_obj_with_fields_from_call_args() -> None:
     """Tests the `extract_tool_return` function parsing obj and fields from call args."""
 
@@ -0,0 +1,186 @@
+"""Tests the `_utils.get_cache_key` function."""
+
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+from mirascope.core.base._cache import (
+    CacheKey,
+    ExtractionCache,
+    SemanticExtractionCache,
+)
+from mirascope.core.base._utils._get_cache_key import get_cache_key
+from mirascope.core.base.message_param import BaseMessageParam, ImagePart, TextPart
+from mirascope.core.base.prompt import prompt_template
+from mirascope.core.base.tool import BaseTool
+
+
+def test_get_cache_key() -> None:
+    """Tests the `get_cache_key` function."""
+
+    @prompt_template("Recommend a {genre} book.")
+    def fn(genre: str) -> None: ...  # pragma: no cover
+
+    def key(genre: str, call_params: dict, static_fields: tuple[str, ...]) -> CacheKey:
+        return get_cache_key(
+            fn=fn,
+            fn_args={"genre": genre},
+            dynamic_config=None,
+            tool_type=BaseTool,
+            call_params=call_params,  # pyright: ignore [reportArgumentType]
+            fields_from_call_args={},
+            static_key=ExtractionCache.hasher(*static_fields),
+        )
+
+    fantasy_key = key("fantasy", {"temperature": 0}, ("provider", "model"))
+    assert fantasy_key == key("fantasy", {"temperature": 0}, ("provider", "model"))
+    assert fantasy_key != key("mystery", {"temperature": 0}, ("provider", "model"))
+    assert fantasy_key != key("fantasy", {"temperature": 1}, ("provider", "model"))
+    assert fantasy_key != key("fantasy", {"temperature": 0}, ("provider", "other"))
+    assert fantasy_key.text == "fantasy"
+
+    mystery_key = key("mystery", {"temperature": 0}, ("provider", "model"))
+    assert mystery_key.scope == fantasy_key.scope
+    assert mystery_key.text == "mystery"
+    assert fantasy_key.scope != key("fantasy", {}, ("provider", "model")).scope
+
+
+def test_get_cache_key_prompt_scope() -> None:
+    """Tests that the prompt is part of the scope and its inputs are the text."""
+
+    @prompt_template("Recommend a {genre} book.")
+    def recommend_book(genre: str) -> None: ...  # pragma: no cover
+
+    @prompt_template("Recommend a {genre} book by {author}.")
+    def recommend_author_book(genre: str) -> None: ...  # pragma: no cover
+
+    @prompt_template("List {count} {genre} books.")
+    def list_books(genre: str, count: int) -> None: ...  # pragma: no cover
+
+    def key(fn: Callable, fn_args: dict, dynamic_config: dict | None) -> CacheKey:
+        return get_cache_key(
+            fn=fn,
+            fn_args=fn_args,
+            dynamic_config=dynamic_config,  # pyright: ignore [reportArgumentType]
+            tool_type=BaseTool,
+            call_params={},
+            fields_from_call_args={},
+            static_key=ExtractionCache.hasher("provider", "model"),
+        )
+
+    recommend_key = key(recommend_book, {"genre": "fantasy"}, None)
+    author_key = key(
+        recommend_author_book,
+        {"genre": "fantasy"},
+        {"computed_fields": {"author": "Patrick Rothfuss"}},
+    )
+    list_key = key(list_books, {"genre": "fantasy", "count": 3}, None)
+    assert len({recommend_key.scope, author_key.scope, list_key.scope}) == 3
+    assert author_key.text == "fantasy\n\nPatrick Rothfuss"
+    assert list_key.text == "fantasy\n\n3"
+
+
+def test_get_cache_key_shared_template_semantic_miss(tmp_path: Path) -> None:
+    """Tests that different inputs to a long shared template don't hit semantically."""
+
+    @prompt_template(
+        """
+        SYSTEM:
+        You are a librarian. Extract the title and author of the book described by
+        the user. Use the canonical title and the full name of the author, correct
+        any typos, and ignore any commentary that isn't about the book itself.
+
+        USER: {text}
+        """
+    )
+    def fn(text: str) -> None: ...  # pragma: no cover
+
+    def embed(text: str) -> list[float]:
+        counts = Counter(text.lower().split())
+        return [float(counts[word]) for word in sorted(vocabulary)]
+
+    def key(text: str) -> CacheKey:
+        return get_cache_key(
+            fn=fn,
+            fn_args={"text": text},
+            dynamic_config=None,
+            tool_type=BaseTool,
+            call_params={},
+            fields_from_call_args={},
+            static_key=ExtractionCache.hasher("provider", "model"),
+        )
+
+    name_of_the_wind = key("The Name of the Wind by Patrick Rothfuss")
+    mistborn = key("Mistborn by Brandon Sanderson")
+    vocabulary = set(
+        " ".join([fn.__doc__ or "", name_of_the_wind.text, mistborn.text])
+        .lower()
+        .split()
+    )
+    assert mistborn.scope == name_of_the_wind.scope
+    cache = SemanticExtractionCache(embed, tmp_path)
+    cache.store(name_of_the_wind, '{"title": "The Name of the Wind"}')
+    assert cache.lookup(mistborn) is None
+
+
+def test_get_cache_key_non_text_content() -> None:
+    """Tests that non-text content is part of the scope of the `get_cache_key`."""
+
+    def key(messages: list) -> CacheKey:
+        return get_cache_key(
+            fn=lambda: None,  # pragma: no cover
+            fn_args={},
+            dynamic_config={"messages": messages},
+            tool_type=BaseTool,
+            call_params={},
+            fields_from_call_args={},
+            static_key=ExtractionCache.hasher("provider", "model"),
+        )
+
+    def image_message(image: bytes) -> BaseMessageParam:
+        return BaseMessageParam(
+            role="user",
+            content=[
+                TextPart(type="text", text="Describe this image."),
+                ImagePart(
+                    type="image", media_type="image/png", image=image, detail=None
+                ),
+            ],
+        )
+
+    image_key = key([image_message(b"\x89PNG\r\n\x1a\n\x00")])
+    other_image_key = key([image_message(b"\x89PNG\r\n\x1a\n\x01")])
+    assert image_key.text == other_image_key.text == ""
+    assert image_key.scope != other_image_key.scope
+
+    custom_key = key([{"role": "user", "content": "Recommend a book."}])
+    assert custom_key.text == ""
+    assert custom_key.scope != key([{"role": "user", "content": "Hi."}]).scope
+
+
+def test_get_cache_key_binary_inputs() -> None:
+    """Tests that binary inputs are part of the scope rather than the text."""
+
+    @prompt_template(
+        "Describe this {genre} book cover: {image:image} Related: {related:images}"
+    )
+    def fn(
+        genre: str, image: bytes, related: list[bytes]
+    ) -> None: ...  # pragma: no cover
+
+    def key(image: bytes) -> CacheKey:
+        return get_cache_key(
+            fn=fn,
+            fn_args={"genre": "fantasy", "image": image, "related": [image]},
+            dynamic_config=None,
+            tool_type=BaseTool,
+            call_params={},
+            fields_from_call_args={},
+            static_key=ExtractionCache.hasher("provider", "model"),
+        )
+
+    png = b"\x89PNG\r\n\x1a\n\x00"
+    image_key = key(png)
+    assert image_key.text == "fantasy"
+    assert image_key == key(png)
+    assert image_key.scope != key(png + b"\x00").scope
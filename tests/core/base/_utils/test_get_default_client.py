@@ -0,0 +1,14 @@
+"""Tests the `_utils.get_default_client` function."""
+
+from unittest.mock import MagicMock
+
+from mirascope.core.base._utils._get_default_client import get_default_client
+
+
+def test_get_default_client() -> None:
+    """Tests that default clients are constructed once and shared."""
+    client_type = MagicMock()
+    client = get_default_client(client_type)
+    assert client is client_type.return_value
+    assert get_default_client(client_type) is client
+    client_type.assert_called_once_with()
@@ -1,6 +1,9 @@
 """Tests the `_utils.get_template_variables` module."""
 
-from mirascope.core.base._utils._get_template_variables import get_template_variables
+from mirascope.core.base._utils._get_template_variables import (
+    _parse_template,
+    get_template_variables,
+)
 
 
 def test_get_template_variables() -> None:
@@ -11,3 +14,16 @@ def test_get_template_variables() -> None:
         ("variable", ""),
         ("multiple", "spec"),
     ]
+
+
+def test_get_template_variables_cached() -> None:
+    """Tests that each template string is only parsed once."""
+    template = "Recommend a {genre} book about {topic:list}."
+    _parse_template.cache_clear()
+    assert get_template_variables(template, False) == ["genre", "topic"]
+    assert get_template_variables(template, True) == [
+        ("genre", ""),
+        ("topic", "list"),
+    ]
+    assert _parse_template.cache_info().misses == 1
+    assert _parse_template.cache_info().hits == 1
@@ -1,5 +1,9 @@
 """Tests the `_utils.setup_call` function."""
 
+import gc
+import weakref
+from unittest.mock import MagicMock, patch
+
 from mirascope.core.base._utils._setup_call import setup_call
 from mirascope.core.base.dynamic_config import BaseDynamicConfig
 from mirascope.core.base.message_param import BaseMessageParam
@@ -91,6 +95,81 @@ def test_setup_call_with_dynamic_config() -> None:
     }
 
 
+def test_setup_call_reuses_converted_tools() -> None:
+    """Tests that `setup_call` converts each tool and generates its schema once."""
+
+    class FormatBook(BaseTool):
+        title: str
+        author: str
+
+        def call(self) -> None:
+            """Format book tool call method."""
+
+    tool_schema = MagicMock(return_value={"type": "function", "name": "FormatBook"})
+
+    @prompt_template("Recommend a {genre} book.")
+    def fn(genre: str) -> None: ...  # pragma: no cover
+
+    with patch.object(FormatBook, "tool_schema", tool_schema):
+        _, _, tool_types, call_kwargs = setup_call(
+            fn, {"genre": "fantasy"}, None, [FormatBook], FormatBook, {}
+        )
+        _, _, next_tool_types, next_call_kwargs = setup_call(
+            fn, {"genre": "fantasy"}, None, [FormatBook], FormatBook, {}
+        )
+
+    assert tool_types and next_tool_types
+    assert tool_types[0] is next_tool_types[0]
+    assert call_kwargs == next_call_kwargs
+    assert call_kwargs["tools"] == [{"type": "function", "name": "FormatBook"}]  # pyright: ignore [reportTypedDictNotRequiredAccess]
+    assert call_kwargs["tools"][0] is not next_call_kwargs["tools"][0]  # pyright: ignore [reportTypedDictNotRequiredAccess]
+    tool_schema.assert_called_once()
+
+
+def test_setup_call_does_not_retain_tools() -> None:
+    """Tests that `setup_call` does not keep tools alive after the call."""
+
+    class SchemaTool(BaseTool):
+        @classmethod
+        def tool_schema(cls) -> dict:
+            return {"type": "function", "name": cls._name()}
+
+    class Library:
+        def add_book(self, title: str) -> None:
+            """Adds a book to the library."""
+
+    def make_tool_class() -> type[BaseTool]:
+        class FormatBook(BaseTool):
+            title: str
+
+            def call(self) -> None:
+                """Format book tool call method."""
+
+        return FormatBook
+
+    @prompt_template("Recommend a {genre} book.")
+    def fn(genre: str) -> None: ...  # pragma: no cover
+
+    library, format_book = Library(), make_tool_class()
+    library_ref, format_book_ref = weakref.ref(library), weakref.ref(format_book)
+    _, _, tool_types, call_kwargs = setup_call(
+        fn,
+        {"genre": "fantasy"},
+        None,
+        [library.add_book, format_book],
+        SchemaTool,
+        {},
+    )
+    assert call_kwargs["tools"] == [  # pyright: ignore [reportTypedDictNotRequiredAccess]
+        {"type": "function", "name": "add_book"},
+        {"type": "function", "name": "FormatBook"},
+    ]
+    del library, format_book, tool_types, call_kwargs
+    gc.collect()
+    assert library_ref() is None
+    assert format_book_ref() is None
+
+
 def test_setup_call_with_custom_messages() -> None:
     """Tests the `setup_call` function with custom messages."""
 
@@ -0,0 +1,164 @@
+"""Tests the internal `_cache` module."""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.base._cache import (
+    CacheKey,
+    ExtractionCache,
+    SemanticExtractionCache,
+)
+
+
+def test_extraction_cache_key() -> None:
+    """Tests that `ExtractionCache.key` is deterministic and length-prefixed."""
+    assert ExtractionCache.key("a", b"b") == ExtractionCache.key(b"a", "b")
+    assert ExtractionCache.key("ab", "c") != ExtractionCache.key("a", "bc")
+    assert len(ExtractionCache.key("a")) == 64
+
+
+def test_extraction_cache_key_prefix() -> None:
+    """Tests that a `prefix` hasher is equivalent to leading fields and is reusable."""
+    prefix = ExtractionCache.hasher("provider", "model")
+    assert ExtractionCache.key("a", prefix=prefix) == ExtractionCache.key(
+        "provider", "model", "a"
+    )
+    assert ExtractionCache.key("a", prefix=prefix) == ExtractionCache.key(
+        "a", prefix=prefix
+    )
+
+
+def test_extraction_cache_key_sha256_fallback() -> None:
+    """Tests that `ExtractionCache.key` falls back to SHA-256 without `blake3`."""
+    with patch("mirascope.core.base._cache.has_blake3", False):
+        key = ExtractionCache.key("a")
+    expected = hashlib.sha256()
+    expected.update((1).to_bytes(8, "little"))
+    expected.update(b"a")
+    assert key == expected.hexdigest()
+
+
+def test_extraction_cache_key_blake3() -> None:
+    """Tests that `ExtractionCache.key` uses BLAKE3 when `blake3` is installed."""
+    fake_blake3 = SimpleNamespace(blake3=hashlib.sha3_256)
+    with (
+        patch("mirascope.core.base._cache.has_blake3", True),
+        patch("mirascope.core.base._cache.blake3", fake_blake3, create=True),
+    ):
+        key = ExtractionCache.key("a")
+    expected = hashlib.sha3_256()
+    expected.update((1).to_bytes(8, "little"))
+    expected.update(b"a")
+    assert key == expected.hexdigest()
+
+
+def test_extraction_cache_get_set(tmp_path: Path) -> None:
+    """Tests getting and setting entries in the `ExtractionCache`."""
+    cache = ExtractionCache(tmp_path / "cache")
+    assert cache.get("key") is None
+    cache.set("key", '{"title": "The Name of the Wind"}')
+    assert cache.get("key") == '{"title": "The Name of the Wind"}'
+    assert [path.name for path in (tmp_path / "cache").iterdir()] == ["key.json"]
+    cache.set("key", '{"title": "Kafka am Strand – 海辺のカフカ"}')
+    assert (tmp_path / "cache" / "key.json").read_bytes().decode("utf-8") == (
+        '{"title": "Kafka am Strand – 海辺のカフカ"}'
+    )
+
+
+def test_extraction_cache_set_concurrent(tmp_path: Path) -> None:
+    """Tests that concurrent writers of the same key don't collide."""
+    cache = ExtractionCache(tmp_path)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [
+            executor.submit(cache.set, "key", f'{{"value": {i}}}') for i in range(200)
+        ]:
+            future.result()
+    assert [path.name for path in tmp_path.iterdir()] == ["key.json"]
+
+
+def test_extraction_cache_set_error(tmp_path: Path) -> None:
+    """Tests that a failed write doesn't leave a temporary file behind."""
+    cache = ExtractionCache(tmp_path)
+    with (
+        patch("mirascope.core.base._cache.os.replace", side_effect=OSError),
+        pytest.raises(OSError),
+    ):
+        cache.set("key", "{}")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_extraction_cache_default_dir() -> None:
+    """Tests the default `cache_dir` of the `ExtractionCache`."""
+    assert ExtractionCache().cache_dir == Path.home() / ".cache" / "mirascope"
+
+
+def test_extraction_cache_lookup_store(tmp_path: Path) -> None:
+    """Tests that `ExtractionCache` only hits on the exact key of a call."""
+    cache = ExtractionCache(tmp_path)
+    cache_key = CacheKey(key="key", scope="scope", text="text")
+    assert cache.lookup(cache_key) is None
+    cache.store(cache_key, '{"title": "The Name of the Wind"}')
+    assert cache.lookup(cache_key) == '{"title": "The Name of the Wind"}'
+    assert cache.lookup(cache_key._replace(key="other")) is None
+
+
+def test_semantic_extraction_cache(tmp_path: Path) -> None:
+    """Tests that `SemanticExtractionCache` hits on similar text in the same scope."""
+    embeddings = {
+        "The Name of the Wind by Patrick Rothfuss": [1.0, 0.0, 0.0],
+        "'The Name of the Wind' - Patrick Rothfuss": [0.99, 0.1, 0.0],
+        "Mistborn by Brandon Sanderson": [0.0, 1.0, 0.0],
+        "Empty": [0.0, 0.0, 0.0],
+    }
+    embed_calls = []
+
+    def embed(text: str) -> list[float]:
+        embed_calls.append(text)
+        return embeddings[text]
+
+    cache = SemanticExtractionCache(embed, tmp_path)
+    assert cache.threshold == 0.92
+    name_of_the_wind = CacheKey(
+        key="a", scope="scope", text="The Name of the Wind by Patrick Rothfuss"
+    )
+    assert cache.lookup(name_of_the_wind) is None
+    cache.store(name_of_the_wind, '{"title": "The Name of the Wind"}')
+    assert embed_calls == ["The Name of the Wind by Patrick Rothfuss"]
+
+    assert cache.lookup(name_of_the_wind) == '{"title": "The Name of the Wind"}'
+    similar = CacheKey(
+        key="b", scope="scope", text="'The Name of the Wind' - Patrick Rothfuss"
+    )
+    assert cache.lookup(similar) == '{"title": "The Name of the Wind"}'
+    assert cache.lookup(similar._replace(scope="other")) is None
+    mistborn = CacheKey(key="c", scope="scope", text="Mistborn by Brandon Sanderson")
+    assert cache.lookup(mistborn) is None
+    assert cache.lookup(CacheKey(key="d", scope="scope", text="Empty")) is None
+
+    strict_cache = SemanticExtractionCache(embed, tmp_path, threshold=0.999)
+    assert strict_cache.lookup(similar) is None
+    assert cache._connect() is cache._connect()
+
+
+def test_semantic_extraction_cache_dimension_mismatch(tmp_path: Path) -> None:
+    """Tests that `SemanticExtractionCache` skips entries of other dimensions."""
+    SemanticExtractionCache(lambda text: [1.0, 0.0], tmp_path).store(
+        CacheKey(key="a", scope="scope", text="a"), "{}"
+    )
+    cache = SemanticExtractionCache(lambda text: [1.0, 0.0, 0.0], tmp_path)
+    assert cache.lookup(CacheKey(key="b", scope="scope", text="b")) is None
+
+
+def test_semantic_extraction_cache_empty_text(tmp_path: Path) -> None:
+    """Tests that `SemanticExtractionCache` never embeds empty text."""
+    embed = MagicMock(return_value=[1.0, 0.0])
+    cache = SemanticExtractionCache(embed, tmp_path)
+    cache.store(CacheKey(key="a", scope="scope", text=""), "{}")
+    assert cache.lookup(CacheKey(key="a", scope="scope", text="")) == "{}"
+    assert cache.lookup(CacheKey(key="b", scope="scope", text="")) is None
+    embed.assert_not_called()
@@ -98,6 +98,7 @@ def test_call_factory_extract(
         "json_mode": False,
         "client": MagicMock(),
         "call_params": MagicMock(),
+        "cache": None,
     }
     _ = call(**extract_kwargs)
     mock_extract_factory.assert_called_once_with(
@@ -153,3 +154,23 @@ def test_call_decorator_invalid_output_parser_with_stream(
         ValueError, match="Cannot use `output_parser` with `stream=True`"
     ):
         call("model", stream=True, output_parser=MagicMock())
+
+
+def test_call_decorator_invalid_cache(mock_call_factory_kwargs: dict) -> None:
+    """Tests a ValueError is raised if `cache` is provided without extraction."""
+    call = call_factory(**mock_call_factory_kwargs)
+    with pytest.raises(ValueError, match="Cannot use `cache` without `response_model`"):
+        call("model", cache=MagicMock())  # pyright: ignore [reportCallIssue]
+    with pytest.raises(ValueError, match="Cannot use `cache` without `response_model`"):
+        call("model", stream=True, response_model=MagicMock, cache=MagicMock())  # pyright: ignore [reportCallIssue]
+
+
+@patch("mirascope.core.base._call_factory.create_factory", new_callable=MagicMock)
+def test_call_factory_builds_decorators_once(
+    mock_create_factory: MagicMock, mock_call_factory_kwargs: dict
+) -> None:
+    """Tests that the provider-specific decorators are built once per `call_factory`."""
+    call = call_factory(**mock_call_factory_kwargs)
+    _ = call("model")
+    _ = call("other-model")
+    mock_create_factory.assert_called_once()
@@ -1,12 +1,16 @@
 """Tests the internal `_extract` module."""
 
 from functools import partial
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, Field, ValidationError
 
+from mirascope.core.base._cache import CacheKey, ExtractionCache
 from mirascope.core.base._extract import extract_factory
+from mirascope.core.base.message_param import BaseMessageParam
+from mirascope.core.base.tool import BaseTool
 
 
 @pytest.fixture()
@@ -162,3 +166,208 @@ async def test_extract_factory_async(
         error = e
     assert error is not None
     assert error._response == mock_create_inner.return_value  # type: ignore
+
+
+class Book(BaseModel):
+    """A book for testing the extraction cache."""
+
+    title: str
+
+
+class CacheCallResponse:
+    """A call response type with a provider for testing the extraction cache."""
+
+    _provider = "provider"
+
+
+@patch("mirascope.core.base._extract.get_cache_key", new_callable=MagicMock)
+@patch("mirascope.core.base._extract.setup_extract_tool", new_callable=MagicMock)
+@patch("mirascope.core.base._extract.extract_tool_return", new_callable=MagicMock)
+@patch("mirascope.core.base._extract.create_factory", new_callable=MagicMock)
+def test_extract_factory_cache_sync(
+    mock_create_factory: MagicMock,
+    mock_extract_tool_return: MagicMock,
+    mock_setup_extract_tool: MagicMock,
+    mock_get_cache_key: MagicMock,
+    mock_setup_call: MagicMock,
+    mock_extract_decorator_kwargs: dict,
+    tmp_path: Path,
+) -> None:
+    """Tests the `extract_factory` method with an `ExtractionCache`."""
+    mock_create_decorator = MagicMock()
+    mock_create_inner = MagicMock()
+    mock_create_decorator.return_value = mock_create_inner
+    mock_create_factory.return_value = mock_create_decorator
+    mock_extract_tool_return.side_effect = lambda *args: Book(
+        title="The Name of the Wind"
+    )
+    mock_setup_extract_tool.return_value.model_json_schema.return_value = {}
+    mock_get_cache_key.return_value = CacheKey(key="key", scope="scope", text="text")
+    cache = ExtractionCache(tmp_path)
+
+    decorator = partial(
+        extract_factory(
+            TCallResponse=CacheCallResponse,  # pyright: ignore [reportArgumentType]
+            TToolType=MagicMock,
+            setup_call=mock_setup_call,
+            get_json_output=MagicMock(return_value='{"title": "The Name of the Wind"}'),
+        ),
+        **mock_extract_decorator_kwargs | {"response_model": Book},
+        cache=cache,
+    )
+
+    def fn(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    decorated_fn = decorator(fn)
+    output = decorated_fn("fantasy")
+    assert output == Book(title="The Name of the Wind")
+    assert cache.get("key") == '{"title": "The Name of the Wind"}'
+    mock_create_with_dynamic_config = mock_create_inner._create_with_dynamic_config
+    mock_create_with_dynamic_config.assert_called_once_with(
+        {"genre": "fantasy"},
+        {
+            "messages": [
+                BaseMessageParam(role="user", content="Recommend a fantasy book")
+            ]
+        },
+    )
+    mock_create_inner.assert_not_called()
+
+    cached_output = decorated_fn("fantasy")
+    assert cached_output == Book(title="The Name of the Wind")
+    assert not hasattr(cached_output, "_response")
+    mock_create_with_dynamic_config.assert_called_once()
+    mock_extract_tool_return.assert_called_with(
+        Book, '{"title": "The Name of the Wind"}', False, {}
+    )
+    static_key = mock_get_cache_key.call_args.kwargs["static_key"]
+    assert (
+        static_key.hexdigest()
+        == ExtractionCache.hasher("provider", "model", "True", "{}").hexdigest()
+    )
+
+
+@patch("mirascope.core.base._extract.get_cache_key", new_callable=MagicMock)
+@patch("mirascope.core.base._extract.setup_extract_tool", new_callable=MagicMock)
+@patch("mirascope.core.base._extract.extract_tool_return", new_callable=MagicMock)
+@patch("mirascope.core.base._extract.create_factory", new_callable=MagicMock)
+@pytest.mark.asyncio
+async def test_extract_factory_cache_async(
+    mock_create_factory: MagicMock,
+    mock_extract_tool_return: MagicMock,
+    mock_setup_extract_tool: MagicMock,
+    mock_get_cache_key: MagicMock,
+    mock_setup_call: MagicMock,
+    mock_extract_decorator_kwargs: dict,
+    tmp_path: Path,
+) -> None:
+    """Tests the `extract_factory` method with an `ExtractionCache` on an async fn."""
+    mock_create_decorator = MagicMock()
+    mock_create_inner = AsyncMock()
+    mock_create_decorator.return_value = mock_create_inner
+    mock_create_factory.return_value = mock_create_decorator
+    mock_extract_tool_return.side_effect = lambda *args: Book(
+        title="The Name of the Wind"
+    )
+    mock_setup_extract_tool.return_value.model_json_schema.return_value = {}
+    mock_get_cache_key.return_value = CacheKey(key="key", scope="scope", text="text")
+    cache = ExtractionCache(tmp_path)
+
+    decorator = partial(
+        extract_factory(
+            TCallResponse=CacheCallResponse,  # pyright: ignore [reportArgumentType]
+            TToolType=MagicMock,
+            setup_call=mock_setup_call,
+            get_json_output=MagicMock(return_value='{"title": "The Name of the Wind"}'),
+        ),
+        **mock_extract_decorator_kwargs | {"response_model": Book},
+        cache=cache,
+    )
+
+    async def fn(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    decorated_fn = decorator(fn)
+    assert await decorated_fn("fantasy") == Book(title="The Name of the Wind")
+    assert await decorated_fn("fantasy") == Book(title="The Name of the Wind")
+    mock_create_inner._create_with_dynamic_config.assert_awaited_once_with(
+        {"genre": "fantasy"},
+        {
+            "messages": [
+                BaseMessageParam(role="user", content="Recommend a fantasy book")
+            ]
+        },
+    )
+    mock_create_inner.assert_not_awaited()
+
+
+def test_extract_factory_cache_renders_prompt_once(
+    mock_setup_call: MagicMock, tmp_path: Path
+) -> None:
+    """Tests that a cache miss runs the prompt function only once."""
+    mock_get_json_output = MagicMock(return_value='{"title": "The Name of the Wind"}')
+    decorator = partial(
+        extract_factory(
+            TCallResponse=MagicMock(_provider="provider"),
+            TToolType=BaseTool,
+            setup_call=mock_setup_call,
+            get_json_output=mock_get_json_output,
+        ),
+        model="model",
+        response_model=Book,
+        output_parser=None,
+        json_mode=True,
+        client=None,
+        call_params={},
+        cache=ExtractionCache(tmp_path),
+    )
+    genres = []
+
+    def fn(genre: str) -> str:
+        genres.append(genre)
+        return f"Recommend a {genre} book"
+
+    output = decorator(fn)("fantasy")
+    assert output == Book(title="The Name of the Wind")
+    assert genres == ["fantasy"]
+    mock_setup_call.assert_called_once()
+    assert mock_setup_call.call_args.kwargs["dynamic_config"] == {
+        "messages": [BaseMessageParam(role="user", content="Recommend a fantasy book")]
+    }
+
+
+def test_extract_factory_cache_aliased_model(
+    mock_setup_call: MagicMock, tmp_path: Path
+) -> None:
+    """Tests that cache hits validate the provider's output like fresh calls."""
+
+    class AliasedBook(BaseModel):
+        title: str = Field(alias="bookTitle")
+
+    def fn(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    mock_get_json_output = MagicMock(
+        return_value='{"bookTitle": "The Name of the Wind"}'
+    )
+    decorated_fn = extract_factory(
+        TCallResponse=MagicMock(_provider="provider"),
+        TToolType=BaseTool,
+        setup_call=mock_setup_call,
+        get_json_output=mock_get_json_output,
+    )(
+        fn,
+        model="model",
+        response_model=AliasedBook,
+        output_parser=None,
+        json_mode=True,
+        client=None,
+        call_params={},
+        cache=ExtractionCache(tmp_path),
+    )
+    assert decorated_fn("fantasy").title == "The Name of the Wind"
+    cached_output = decorated_fn("fantasy")
+    assert cached_output.title == "The Name of the Wind"
+    assert not hasattr(cached_output, "_response")
+    mock_setup_call.assert_called_once()
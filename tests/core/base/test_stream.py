@@ -1,7 +1,7 @@
 """Tests the `stream` module."""
 
 from functools import partial
-from typing import cast
+from typing import Any, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -228,3 +228,88 @@ async def test_base_stream(mock_get_possible_user_message_param: MagicMock) -> N
 
     assert stream.tool_message_params(tools_and_outputs)
     mock_tool_message_params.assert_called_once_with(tools_and_outputs)
+
+
+class TextStream(BaseStream):
+    """A minimal concrete `BaseStream` for testing content batching."""
+
+    @property
+    def cost(self) -> None:
+        return None  # pragma: no cover
+
+    def _construct_message_param(
+        self, tool_calls: list | None = None, content: str | None = None
+    ) -> dict:
+        return {"role": "assistant", "content": content}
+
+    def construct_call_response(self) -> None: ...  # pragma: no cover
+
+
+def _text_chunk(content: str) -> MagicMock:
+    return MagicMock(
+        content=content,
+        input_tokens=None,
+        output_tokens=None,
+        model=None,
+        id=None,
+        finish_reasons=None,
+    )
+
+
+def _text_stream(stream: Any) -> TextStream:
+    return TextStream(
+        stream=stream,
+        metadata={},
+        tool_types=None,
+        call_response_type=MagicMock,
+        model="model",
+        prompt_template=None,
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )
+
+
+def test_base_stream_batched_content() -> None:
+    """Tests that `batched_content` grows the batch size from a single chunk."""
+    chunks = [_text_chunk(str(i)) for i in range(10)] + [_text_chunk("")]
+    stream = _text_stream((chunk, None) for chunk in chunks)
+    batches = list(
+        stream.batched_content(max_batch_size=4, flush_interval=60, growth_factor=2)
+    )
+    assert batches == ["0", "12", "3456", "789"]
+    assert stream.content == "0123456789"
+    assert stream.message_param == {"role": "assistant", "content": "0123456789"}
+
+
+def test_base_stream_batched_content_flush_interval() -> None:
+    """Tests that `batched_content` flushes every chunk with a zero interval."""
+    chunks = [_text_chunk(str(i)) for i in range(3)]
+    stream = _text_stream((chunk, None) for chunk in chunks)
+    assert list(stream.batched_content(max_batch_size=50, flush_interval=0)) == [
+        "0",
+        "1",
+        "2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_base_stream_batched_content_async() -> None:
+    """Tests the `batched_content_async` method."""
+    chunks = [_text_chunk(str(i)) for i in range(5)]
+
+    async def generator():
+        for chunk in chunks:
+            yield chunk, None
+
+    stream = _text_stream(generator())
+    batches = [
+        batch
+        async for batch in stream.batched_content_async(
+            max_batch_size=3, flush_interval=60
+        )
+    ]
+    assert batches == ["0", "123", "4"]
+    assert stream.content == "01234"
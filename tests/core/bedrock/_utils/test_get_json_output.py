@@ -52,7 +52,7 @@ def test_get_json_output_call_response() -> None:
     ]
     assert (
         get_json_output(call_response, json_mode=False)
-        == '{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}'
+        == '{"title":"The Name of the Wind","author":"Patrick Rothfuss"}'
     )
 
     message["content"] = [{"type": "toolUse", "toolUse": {}}]
@@ -44,7 +44,7 @@ def test_get_json_output_call_response() -> None:
     assert get_json_output(call_response, json_mode=True) == "json_output"
     assert (
         get_json_output(call_response, json_mode=False)
-        == '{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}'
+        == '{"title":"The Name of the Wind","author":"Patrick Rothfuss"}'
     )
 
     call_response = CohereCallResponse(
@@ -92,7 +92,7 @@ def test_get_json_output_call_response_chunk() -> None:
     call_response_chunk_tool_calls = CohereCallResponseChunk(chunk=chunk_tool_calls)
     assert (
         get_json_output(call_response_chunk_tool_calls, json_mode=False)
-        == '{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}'
+        == '{"title":"The Name of the Wind","author":"Patrick Rothfuss"}'
     )
     chunk_end = StreamedChatResponse_StreamEnd(
         finish_reason="COMPLETE",
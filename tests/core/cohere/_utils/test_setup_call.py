@@ -8,6 +8,7 @@ import pytest
 from cohere import NonStreamedChatResponse
 from cohere.types import ChatMessage
 
+from mirascope.core.base._utils import get_default_client
 from mirascope.core.cohere._utils._setup_call import setup_call
 from mirascope.core.cohere.tool import CohereTool
 
@@ -43,6 +44,7 @@ def test_setup_call(
     mock_chat.__name__ = "chat"
     mock_chat_stream.__name__ = "chat_stream"
     mock_utils.setup_call = mock_base_setup_call
+    mock_utils.get_default_client = get_default_client
     system_message = "system"
     preamble_message = "preamble"
     mock_base_setup_call.return_value[-1] = {
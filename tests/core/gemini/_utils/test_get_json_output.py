@@ -67,7 +67,7 @@ def test_get_json_output_call_response(
     assert get_json_output(call_response, json_mode=True) == "json_output"
     assert (
         get_json_output(call_response, json_mode=False)
-        == '{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}'
+        == '{"title":"The Name of the Wind","author":"Patrick Rothfuss"}'
     )
 
     mock_generate_content_response.candidates[0].content.parts.pop(1)
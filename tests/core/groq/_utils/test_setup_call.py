@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from mirascope.core.base._utils import get_default_client
 from mirascope.core.groq._utils._setup_call import setup_call
 from mirascope.core.groq.tool import GroqTool
 
@@ -31,6 +32,7 @@ def test_setup_call(
 ) -> None:
     """Tests the `setup_call` function."""
     mock_utils.setup_call = mock_base_setup_call
+    mock_utils.get_default_client = get_default_client
     fn = MagicMock()
     create, prompt_template, messages, tool_types, call_kwargs = setup_call(
         model="llama-3.1-8b-instant",
@@ -11,6 +11,7 @@ from mistralai.models.chat_completion import (
     ToolChoice,
 )
 
+from mirascope.core.base._utils import get_default_client
 from mirascope.core.mistral._utils._setup_call import setup_call
 from mirascope.core.mistral.tool import MistralTool
 
@@ -45,6 +46,7 @@ def test_setup_call(
 ) -> None:
     """Tests the `setup_call` function."""
     mock_utils.setup_call = mock_base_setup_call
+    mock_utils.get_default_client = get_default_client
     mock_chat_iterator = MagicMock()
     mock_chat_iterator.__iter__.return_value = ["chat"]
     mock_mistral_chat_stream.return_value = mock_chat_iterator
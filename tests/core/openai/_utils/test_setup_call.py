@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from mirascope.core.base import ResponseModelConfigDict
+from mirascope.core.base._utils import get_default_client
 from mirascope.core.openai._utils._setup_call import setup_call
 from mirascope.core.openai.tool import OpenAITool
 
@@ -32,6 +33,7 @@ def test_setup_call(
 ) -> None:
     """Tests the `setup_call` function."""
     mock_utils.setup_call = mock_base_setup_call
+    mock_utils.get_default_client = get_default_client
     fn = MagicMock()
     create, prompt_template, messages, tool_types, call_kwargs = setup_call(
         model="gpt-4o",
@@ -193,3 +195,40 @@ def test_setup_call_extract(
             extract=True,
         )
     assert "tool_choice" in call_kwargs and call_kwargs["tool_choice"] == "required"
+
+
+@patch(
+    "mirascope.core.openai._utils._setup_call.get_async_create_fn",
+    new_callable=MagicMock,
+)
+@patch(
+    "mirascope.core.openai._utils._setup_call.convert_message_params",
+    new_callable=MagicMock,
+)
+@patch("mirascope.core.openai._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_async_client(
+    mock_utils: MagicMock,
+    mock_convert_message_params: MagicMock,
+    mock_get_async_create_fn: MagicMock,
+    mock_base_setup_call: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that async calls construct their default client per call."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    mock_utils.setup_call = mock_base_setup_call
+
+    async def fn() -> None: ...  # pragma: no cover
+
+    create, _, _, _, _ = setup_call(
+        model="gpt-4o",
+        client=None,
+        fn=fn,
+        fn_args={},
+        dynamic_config=None,
+        tools=None,
+        json_mode=False,
+        call_params={},
+        extract=False,
+    )
+    assert create == mock_get_async_create_fn.return_value
+    mock_utils.get_default_client.assert_not_called()
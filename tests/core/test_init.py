@@ -0,0 +1,32 @@
+"""Tests the lazy provider imports of `mirascope.core`."""
+
+from unittest.mock import patch
+
+import pytest
+
+import mirascope.core
+
+
+def test_provider_lazy_import() -> None:
+    """Tests that providers are imported on first access."""
+    from mirascope.core import openai
+
+    assert mirascope.core.openai is openai
+
+
+def test_provider_missing_sdk() -> None:
+    """Tests that a provider whose SDK is missing raises an `AttributeError`."""
+    with (
+        patch(
+            "mirascope.core.importlib.import_module",
+            side_effect=ImportError("No module named 'google'"),
+        ),
+        pytest.raises(AttributeError, match="has no attribute 'gemini'"),
+    ):
+        mirascope.core.__getattr__("gemini")
+
+
+def test_unknown_attribute() -> None:
+    """Tests that unknown attributes raise an `AttributeError`."""
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        mirascope.core.__getattr__("unknown")